@@ -379,9 +379,10 @@ class NFI5MOHO_WIP(IStrategy):
         dataframe['kama_offset_buy'] = ta.KAMA(dataframe, timeperiod=self.base_nb_candles_buy.value) * self.low_offset_kama.value
         dataframe['kama_offset_sell'] = ta.KAMA(dataframe, timeperiod=self.base_nb_candles_sell.value) * self.high_offset_kama.value
 
-        dataframe['bb_upperband'] = ta.BBANDS(dataframe, timeperiod=20, nbdevup=2, nbdevdn=2, matype=0)[0]
-        dataframe['bb_middleband'] = ta.BBANDS(dataframe, timeperiod=20, nbdevup=2, nbdevdn=2, matype=0)[1]
-        dataframe['bb_lowerband'] = ta.BBANDS(dataframe, timeperiod=20, nbdevup=2, nbdevdn=2, matype=0)[2]
+        bollinger = ta.BBANDS(dataframe, timeperiod=20, nbdevup=2.0, nbdevdn=2.0, matype=0)
+        dataframe['bb_upperband'] = bollinger['upperband']
+        dataframe['bb_middleband'] = bollinger['middleband']
+        dataframe['bb_lowerband'] = bollinger['lowerband']
         dataframe['bbpercent'] = (dataframe['close'] - dataframe['bb_lowerband']) / (dataframe['bb_upperband'] - dataframe['bb_lowerband'])
         dataframe['bb_width'] = (dataframe['bb_upperband'] - dataframe['bb_lowerband']) / dataframe['bb_middleband']
         dataframe['sar'] = ta.SAR(dataframe)
@@ -395,15 +396,19 @@ class NFI5MOHO_WIP(IStrategy):
         dataframe['adxr'] = ta.ADXR(dataframe, timeperiod=14)
         dataframe['willr'] = ta.WILLR(dataframe, timeperiod=14)
         dataframe['ultosc'] = ta.ULTOSC(dataframe)
-        dataframe['kst'] = ta.KST(dataframe)
-        dataframe['macd'] = ta.MACD(dataframe)[0]
-        dataframe['macdsignal'] = ta.MACD(dataframe)[1]
-        dataframe['macdhist'] = ta.MACD(dataframe)[2]
+        macd = ta.MACD(dataframe)
+        dataframe['macd'] = macd['macd']
+        dataframe['macdsignal'] = macd['macdsignal']
+        dataframe['macdhist'] = macd['macdhist']
         dataframe['ppo'] = ta.PPO(dataframe)
-        dataframe['pposignal'] = ta.PPO(dataframe)[1]
-        dataframe['ppohist'] = ta.PPO(dataframe)[2]
-        dataframe['fastk'], dataframe['fastd'] = ta.STOCHRSI(dataframe, timeperiod=14)
-        dataframe['slowk'], dataframe['slowd'] = ta.STOCH(dataframe)
+        dataframe['pposignal'] = ta.EMA(dataframe['ppo'], timeperiod=9)
+        dataframe['ppohist'] = dataframe['ppo'] - dataframe['pposignal']
+        stoch_rsi = ta.STOCHRSI(dataframe, timeperiod=14)
+        dataframe['fastk'] = stoch_rsi['fastk']
+        dataframe['fastd'] = stoch_rsi['fastd']
+        stoch = ta.STOCH(dataframe)
+        dataframe['slowk'] = stoch['slowk']
+        dataframe['slowd'] = stoch['slowd']
         dataframe['fisher'] = 0.5 * np.log((1 + dataframe['fastk']) / (1 - dataframe['fastk']))
         dataframe['fisher'] = dataframe['fisher'].fillna(0)
         dataframe['ao'] = ta.AO(dataframe)
@@ -419,13 +424,17 @@ class NFI5MOHO_WIP(IStrategy):
         dataframe['mom'] = ta.MOM(dataframe)
         dataframe['plus_di'] = ta.PLUS_DI(dataframe)
         dataframe['rvi'] = ta.RVI(dataframe)
-        dataframe['stoch_k'] = ta.STOCH(dataframe)[0]
-        dataframe['stoch_d'] = ta.STOCH(dataframe)[1]
+        dataframe['stoch_k'] = stoch['slowk']
+        dataframe['stoch_d'] = stoch['slowd']
         dataframe['atr'] = ta.ATR(dataframe)
         dataframe['trix'] = ta.TRIX(dataframe)
         dataframe['ht_trendline'] = ta.HT_TRENDLINE(dataframe)
-        dataframe['ht_sine'], dataframe['ht_leadsine'] = ta.HT_SINE(dataframe)
-        dataframe['ht_phasor_inphase'], dataframe['ht_phasor_quadrature'] = ta.HT_PHASOR(dataframe)
+        ht_sine = ta.HT_SINE(dataframe)
+        dataframe['ht_sine'] = ht_sine['sine']
+        dataframe['ht_leadsine'] = ht_sine['leadsine']
+        ht_phasor = ta.HT_PHASOR(dataframe)
+        dataframe['ht_phasor_inphase'] = ht_phasor['inphase']
+        dataframe['ht_phasor_quadrature'] = ht_phasor['quadrature']
 
         return dataframe
 
@@ -441,8 +450,6 @@ class NFI5MOHO_WIP(IStrategy):
         informative = self.dp.get_pair_dataframe(pair=metadata['pair'], timeframe=self.inf_1h)
         informative = self.informative_tf_indicators(informative, metadata)
         dataframe = merge_informative_pair(dataframe, informative, self.timeframe, self.inf_1h, ffill=True)
-        skip_columns = [(s, s + "_" + self.inf_1h) for s in list(informative.columns) if s != 'date']
-        dataframe = merge_informative_pair(dataframe, informative, self.timeframe, self.inf_1h, ffill=True, skip_columns=skip_columns)
 
         return dataframe
 
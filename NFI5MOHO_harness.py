@@ -0,0 +1,596 @@
+"""
+Numerical-equivalence and speed harness for NFI5MOHO_WIP.
+
+Runs a reference strategy and a candidate (usually an optimised copy) side by
+side on synthetic and recorded OHLCV fixtures and reports:
+
+  * every indicator column diffed within tolerance (populate_indicators + EWO)
+  * the buy/sell signal vectors diffed exactly
+  * custom_exit reasons, replayed from the reference entry points: the reason
+    tag and exit candle exactly, the numbers embedded in the reason within tolerance
+  * best-of-N timings for each stage, including the informative fetch and merge
+
+Both strategies must run under the installed TA-Lib and freqtrade. A compared
+stage that raises is reported as a DIFF with the exception text and the run moves
+on to the next fixture. EWO is looked up as a module-level function next to each
+strategy class; a candidate without one reports it as a missing column.
+
+normal_tf_indicators and informative_merge are timed when the strategy still has
+that split, but only the outputs of populate_indicators, the entry/exit trends,
+EWO and custom_exit decide equivalence.
+
+Usage:
+    python NFI5MOHO_harness.py --candidate my_fast_module:NFI5MOHO_Fast
+    python NFI5MOHO_harness.py --candidate my_fast_module:NFI5MOHO_Fast \\
+        --fixture user_data/data/binance/BTC_USDT-5m.json --output report.json
+
+Without --candidate the reference is compared against itself, which checks
+determinism and gives baseline timings. Exit status is 1 if anything differs.
+"""
+import argparse
+import importlib
+import json
+import os
+import re
+import sys
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+OHLCV_COLUMNS = ['date', 'open', 'high', 'low', 'close', 'volume']
+SIGNAL_COLUMNS = ['buy', 'sell']
+TIMED_STAGES = ['normal_tf_indicators', 'informative_merge', 'populate_indicators', 'populate_entry_trend',
+                'populate_exit_trend', 'EWO', 'custom_exit_replay']
+
+# Floats formatted into custom_exit reasons, e.g. `..._rsi_45.312` or `..._current_profit_-0.02`
+REASON_NUMBER = re.compile(r'(?<=_)(-?(?:\d+\.\d*(?:e[-+]?\d+)?|\d+e[-+]?\d+)|nan|-?inf)(?=_|$)')
+
+
+# Fixtures
+
+def synthetic_ohlcv(candles: int = 3000, timeframe: str = '5m', seed: int = 0, drift: float = 0.0,
+                    volatility: float = 0.004, flat_candles: int = 0,
+                    start: str = '2021-01-01') -> DataFrame:
+    """Geometric random walk OHLCV. `flat_candles` inserts a zero-volume, constant-price stretch."""
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(drift, volatility, candles)
+    close = 100.0 * np.exp(np.cumsum(returns))
+    open_ = np.concatenate(([100.0], close[:-1]))
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, volatility / 2, candles)))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, volatility / 2, candles)))
+    volume = rng.lognormal(mean=8.0, sigma=1.0, size=candles)
+
+    if flat_candles:
+        mid = candles // 2
+        flat = slice(mid, min(mid + flat_candles, candles))
+        price = close[mid - 1]
+        open_[flat] = high[flat] = low[flat] = close[flat] = price
+        volume[flat] = 0.0
+
+    dates = pd.date_range(start=start, periods=candles, freq=_to_offset(timeframe), tz='UTC')
+    return DataFrame({'date': dates, 'open': open_, 'high': high, 'low': low, 'close': close, 'volume': volume})
+
+
+def load_ohlcv(path: str) -> DataFrame:
+    """Load a recorded fixture in freqtrade's json ([ms, o, h, l, c, v] rows), feather or csv layout."""
+    if path.endswith('.feather'):
+        dataframe = pd.read_feather(path)
+    elif path.endswith('.csv'):
+        dataframe = pd.read_csv(path)
+    else:
+        with open(path) as f:
+            dataframe = DataFrame(json.load(f), columns=OHLCV_COLUMNS)
+
+    if pd.api.types.is_numeric_dtype(dataframe['date']):
+        dataframe['date'] = pd.to_datetime(dataframe['date'], unit='ms', utc=True)
+    else:
+        dataframe['date'] = pd.to_datetime(dataframe['date'], utc=True)
+
+    dataframe = dataframe[OHLCV_COLUMNS].astype({c: 'float64' for c in OHLCV_COLUMNS[1:]})
+    return dataframe.sort_values('date').reset_index(drop=True)
+
+
+def resample_ohlcv(dataframe: DataFrame, timeframe: str) -> DataFrame:
+    """Build the informative timeframe from the base candles when no recorded one is given."""
+    resampled = dataframe.resample(_to_offset(timeframe), on='date', label='left', closed='left').agg({
+        'open': 'first',
+        'high': 'max',
+        'low': 'min',
+        'close': 'last',
+        'volume': 'sum',
+    })
+    return resampled.dropna().reset_index()
+
+
+def _to_offset(timeframe: str) -> str:
+    units = {'m': 'min', 'h': 'h', 'd': 'D', 'w': 'W'}
+    return timeframe[:-1] + units[timeframe[-1]]
+
+
+# Strategy plumbing
+
+class FixtureDataProvider:
+    """Serves fixture candles to populate_indicators and the analyzed dataframe to custom_exit."""
+
+    def __init__(self, informative: Dict[str, DataFrame]):
+        self.informative = informative
+        self.analyzed = DataFrame()
+
+    def get_pair_dataframe(self, pair: str, timeframe: str = None, candle_type: str = '') -> DataFrame:
+        return self.informative[timeframe].copy()
+
+    def get_analyzed_dataframe(self, pair: str, timeframe: str):
+        date = self.analyzed['date'].iloc[-1] if len(self.analyzed) else None
+        return self.analyzed, date
+
+
+class ReplayTrade:
+    """Minimal open trade for replaying custom_exit. Profit ignores fees, identically for both sides."""
+
+    def __init__(self, open_rate: float, open_date):
+        self.open_rate = open_rate
+        self.open_date = open_date
+        self.max_rate = open_rate
+        self.min_rate = open_rate
+
+    def calc_profit_ratio(self, rate: float) -> float:
+        return rate / self.open_rate - 1
+
+
+def load_strategy_class(spec: str):
+    """Resolve 'module:ClassName' (module may also be a path to a .py file)."""
+    module_name, _, class_name = spec.partition(':')
+    if module_name.endswith('.py'):
+        sys.path.insert(0, os.path.dirname(os.path.abspath(module_name)))
+        module_name = os.path.splitext(os.path.basename(module_name))[0]
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name or module_name)
+
+
+def build_strategy(strategy_cls, config: Optional[dict] = None):
+    strategy_config = {
+        'timeframe': strategy_cls.timeframe,
+        'stake_currency': 'USDT',
+        'dry_run': True,
+    }
+    strategy_config.update(config or {})
+    return strategy_cls(strategy_config)
+
+
+def _timed(func, make_input, repeat: int):
+    """Best-of-N wall time of func(make_input()). Building the input is not timed."""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        value = make_input()
+        start = time.perf_counter()
+        result = func(value)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def _describe_error(stage: str, error: Exception) -> str:
+    return f'{stage}: {type(error).__name__}: {error}'
+
+
+def run_strategy(strategy_cls, dataframe: DataFrame, informative: DataFrame, metadata: dict,
+                 repeat: int = 3, config: Optional[dict] = None) -> dict:
+    """
+    Run every stage on a private copy of the fixture and return outputs plus best-of-N timings.
+
+    populate_indicators, the entry/exit trends and EWO are the compared outputs: the first of them
+    to raise is recorded in 'error' and the remaining ones are skipped. normal_tf_indicators and
+    informative_merge are timing-only, see _time_informative_split.
+    """
+    result = {'strategy': None, 'indicators': None, 'ewo': None, 'analyzed': None,
+              'timings': {}, 'error': None, 'notes': []}
+    timings = result['timings']
+    stage = 'build_strategy'
+    try:
+        strategy = build_strategy(strategy_cls, config)
+        strategy.dp = FixtureDataProvider({strategy.inf_1h: informative})
+        result['strategy'] = strategy
+
+        stage = 'populate_indicators'
+        result['indicators'], timings[stage] = _timed(
+            lambda df: strategy.populate_indicators(df, metadata), dataframe.copy, repeat)
+        stage = 'populate_entry_trend'
+        entries, timings[stage] = _timed(
+            lambda df: strategy.populate_entry_trend(df, metadata), result['indicators'].copy, repeat)
+        stage = 'populate_exit_trend'
+        analyzed, timings[stage] = _timed(
+            lambda df: strategy.populate_exit_trend(df, metadata), entries.copy, repeat)
+        for column in SIGNAL_COLUMNS:
+            if column not in analyzed.columns:
+                analyzed[column] = 0
+        result['analyzed'] = analyzed
+
+        ewo = getattr(sys.modules[strategy_cls.__module__], 'EWO', None)
+        if ewo is not None:
+            stage = 'EWO'
+            result['ewo'], timings[stage] = _timed(
+                lambda df: ewo(df, strategy.fast_ewo.value, strategy.slow_ewo.value), dataframe.copy, repeat)
+    except Exception as e:
+        result['error'] = _describe_error(stage, e)
+
+    if result['strategy'] is not None:
+        _time_informative_split(result['strategy'], dataframe, metadata, repeat, result)
+    return result
+
+
+def _time_informative_split(strategy, dataframe: DataFrame, metadata: dict, repeat: int, result: dict):
+    """
+    Time normal_tf_indicators, then populate_indicators with normal_tf_indicators served precomputed,
+    which leaves the informative fetch, the informative indicators and the merge. Timing only: a
+    strategy that no longer has this split, or fails inside it, gets a note rather than a DIFF.
+    """
+    timings, notes = result['timings'], result['notes']
+    normal_tf_indicators = getattr(strategy, 'normal_tf_indicators', None)
+    if not callable(normal_tf_indicators):
+        notes.append('no normal_tf_indicators, normal_tf_indicators and informative_merge not timed')
+        return
+
+    stage = 'normal_tf_indicators'
+    try:
+        normal, timings[stage] = _timed(lambda df: normal_tf_indicators(df, metadata), dataframe.copy, repeat)
+
+        stage = 'informative_merge'
+        calls = []
+
+        def precomputed(df, md):
+            calls.append(1)
+            return df
+
+        strategy.normal_tf_indicators = precomputed
+        try:
+            _, elapsed = _timed(lambda df: strategy.populate_indicators(df, metadata), normal.copy, repeat)
+        finally:
+            del strategy.normal_tf_indicators
+        if calls:
+            timings[stage] = elapsed
+        else:
+            notes.append('populate_indicators does not call normal_tf_indicators, informative_merge not timed')
+    except Exception as e:
+        notes.append(_describe_error(stage, e))
+
+
+def replay_exits(strategy, analyzed: DataFrame, entry_rows: List[int], metadata: dict,
+                 max_hold: int = 288) -> Dict[int, Optional[tuple]]:
+    """
+    Open a trade at the close of each entry row and walk forward candle by candle,
+    asking custom_exit for a reason. Returns {entry_row: (exit_row, reason) or None}.
+    """
+    exits = {}
+    closes = analyzed['close'].to_numpy()
+    highs = analyzed['high'].to_numpy()
+    lows = analyzed['low'].to_numpy()
+    dates = analyzed['date']
+
+    for row in entry_rows:
+        trade = ReplayTrade(closes[row], dates.iloc[row])
+        exits[row] = None
+        for current in range(row + 1, min(row + 1 + max_hold, len(analyzed))):
+            trade.max_rate = max(trade.max_rate, highs[current])
+            trade.min_rate = min(trade.min_rate, lows[current])
+            strategy.dp.analyzed = analyzed.iloc[:current + 1]
+            reason = strategy.custom_exit(
+                pair=metadata['pair'], trade=trade, current_time=dates.iloc[current].to_pydatetime(),
+                current_rate=closes[current], current_profit=trade.calc_profit_ratio(closes[current]))
+            if isinstance(reason, tuple):
+                reason = reason[0]
+            if reason:
+                exits[row] = (current, str(reason))
+                break
+
+    return exits
+
+
+def _replay(run: dict, entry_rows: List[int], metadata: dict, repeat: int) -> Optional[dict]:
+    if run['error']:
+        return None
+    try:
+        exits, run['timings']['custom_exit_replay'] = _timed(
+            lambda rows: replay_exits(run['strategy'], run['analyzed'], rows, metadata), lambda: entry_rows, repeat)
+    except Exception as e:
+        run['error'] = _describe_error('custom_exit_replay', e)
+        return None
+    return exits
+
+
+# Diffing
+
+def diff_columns(reference: DataFrame, candidate: DataFrame, rtol: float, atol: float) -> dict:
+    """Per-column comparison. NaN must line up with NaN; non-numeric columns must match exactly."""
+    result = {
+        'missing': sorted(set(reference.columns) - set(candidate.columns)),
+        'extra': sorted(set(candidate.columns) - set(reference.columns)),
+        'mismatched': {},
+    }
+    if len(reference) != len(candidate):
+        result['length'] = [len(reference), len(candidate)]
+        return result
+
+    for column in reference.columns:
+        if column not in candidate.columns:
+            continue
+        mismatch = _column_mismatch(reference[column], candidate[column], rtol, atol)
+        if mismatch is not None:
+            result['mismatched'][column] = mismatch
+
+    return result
+
+
+def _column_mismatch(reference: pd.Series, candidate: pd.Series, rtol: float, atol: float) -> Optional[dict]:
+    """Compare positionally, so a candidate with a different index is diffed row by row."""
+    if len(reference) != len(candidate):
+        return {'length': [len(reference), len(candidate)]}
+    if pd.api.types.is_numeric_dtype(reference) and pd.api.types.is_numeric_dtype(candidate) \
+            and not pd.api.types.is_bool_dtype(reference):
+        ref = reference.to_numpy(dtype='float64')
+        cand = candidate.to_numpy(dtype='float64')
+        with np.errstate(invalid='ignore'):
+            bad = ~np.isclose(ref, cand, rtol=rtol, atol=atol, equal_nan=True)
+            delta = np.abs(ref - cand)
+        if not bad.any():
+            return None
+        finite = np.isfinite(delta)
+        max_abs = float(delta[finite].max()) if finite.any() else None
+        first = int(np.argmax(bad))
+        return {
+            'count': int(bad.sum()),
+            'max_abs_diff': max_abs,
+            'first_row': first,
+            'reference': _plain(ref[first]),
+            'candidate': _plain(cand[first]),
+        }
+
+    ref = reference.to_numpy(dtype=object)
+    cand = candidate.to_numpy(dtype=object)
+    bad = ~((ref == cand) | (pd.isna(ref) & pd.isna(cand)))
+    if not bad.any():
+        return None
+    first = int(np.argmax(bad))
+    return {
+        'count': int(bad.sum()),
+        'first_row': first,
+        'reference': _plain(reference.iloc[first]),
+        'candidate': _plain(candidate.iloc[first]),
+    }
+
+
+def diff_signals(reference: DataFrame, candidate: DataFrame) -> dict:
+    if len(reference) != len(candidate):
+        return {'length': [len(reference), len(candidate)]}
+    result = {}
+    for column in SIGNAL_COLUMNS:
+        ref = reference[column].fillna(0).astype('int64').to_numpy()
+        cand = candidate[column].fillna(0).astype('int64').to_numpy()
+        rows = np.flatnonzero(ref != cand)
+        if len(rows):
+            result[column] = {'count': int(len(rows)), 'rows': rows[:20].tolist()}
+    return result
+
+
+def split_reason(reason: str):
+    """Split an exit reason into its tag (numbers replaced by `{}`) and the embedded numbers."""
+    return REASON_NUMBER.sub('{}', reason), [float(value) for value in REASON_NUMBER.findall(reason)]
+
+
+def _exit_matches(reference: Optional[tuple], candidate: Optional[tuple], rtol: float, atol: float) -> bool:
+    if reference is None or candidate is None:
+        return reference is candidate
+    if reference[0] != candidate[0]:
+        return False
+    ref_tag, ref_values = split_reason(reference[1])
+    cand_tag, cand_values = split_reason(candidate[1])
+    if ref_tag != cand_tag or len(ref_values) != len(cand_values):
+        return False
+    return bool(np.allclose(ref_values, cand_values, rtol=rtol, atol=atol, equal_nan=True))
+
+
+def diff_exit_reasons(reference: Dict[int, Optional[tuple]], candidate: Dict[int, Optional[tuple]],
+                      rtol: float, atol: float) -> dict:
+    """Exit candle and reason tag must match exactly; the numbers in the reason within tolerance."""
+    return {
+        str(row): {'reference': reference[row], 'candidate': candidate.get(row)}
+        for row in reference if not _exit_matches(reference[row], candidate.get(row), rtol, atol)
+    }
+
+
+def _plain(value):
+    if isinstance(value, (np.floating, float)):
+        return None if np.isnan(value) else float(value)
+    if isinstance(value, np.integer):
+        return int(value)
+    return str(value)
+
+
+# Driver
+
+def compare_fixture(reference_cls, candidate_cls, name: str, dataframe: DataFrame,
+                    informative: Optional[DataFrame] = None, pair: str = 'BTC/USDT',
+                    rtol: float = 1e-9, atol: float = 1e-9, repeat: int = 3,
+                    max_trades: int = 200, config: Optional[dict] = None) -> dict:
+    metadata = {'pair': pair}
+    if informative is None:
+        informative = resample_ohlcv(dataframe, reference_cls.inf_1h)
+
+    ref = run_strategy(reference_cls, dataframe, informative, metadata, repeat, config)
+    cand = run_strategy(candidate_cls, dataframe, informative, metadata, repeat, config)
+
+    report = {
+        'fixture': name,
+        'candles': len(dataframe),
+        'entries_replayed': 0,
+        'errors': {side: run['error'] for side, run in (('reference', ref), ('candidate', cand)) if run['error']},
+        'notes': {side: run['notes'] for side, run in (('reference', ref), ('candidate', cand)) if run['notes']},
+        'indicators': {'missing': [], 'extra': [], 'mismatched': {}},
+        'signals': {},
+        'exit_reasons': {},
+    }
+    if ref['indicators'] is not None and cand['indicators'] is not None:
+        report['indicators'] = diff_columns(ref['indicators'], cand['indicators'], rtol, atol)
+    if ref['ewo'] is not None:
+        if cand['ewo'] is not None:
+            ewo_mismatch = _column_mismatch(ref['ewo'], cand['ewo'], rtol, atol)
+            if ewo_mismatch is not None:
+                report['indicators']['mismatched']['EWO()'] = ewo_mismatch
+        elif not cand['error']:
+            report['indicators']['missing'].append('EWO()')
+    if ref['analyzed'] is not None and cand['analyzed'] is not None:
+        report['signals'] = diff_signals(ref['analyzed'], cand['analyzed'])
+
+    # Exits are replayed from the reference's entry rows, which only line up with a candidate
+    # that returned the same number of candles.
+    entry_rows = []
+    if ref['analyzed'] is not None:
+        entry_rows = np.flatnonzero(ref['analyzed']['buy'].fillna(0).to_numpy() == 1)[:max_trades].tolist()
+    aligned = 'length' not in report['indicators'] and 'length' not in report['signals']
+    ref_exits = _replay(ref, entry_rows, metadata, repeat)
+    cand_exits = _replay(cand, entry_rows, metadata, repeat) if aligned else None
+    for side, run in (('reference', ref), ('candidate', cand)):
+        if run['error'] and side not in report['errors']:
+            report['errors'][side] = run['error']
+    if ref_exits is not None and cand_exits is not None:
+        report['entries_replayed'] = len(entry_rows)
+        report['exit_reasons'] = diff_exit_reasons(ref_exits, cand_exits, rtol, atol)
+
+    report['timings'] = {
+        stage: {
+            'reference': ref['timings'].get(stage),
+            'candidate': cand['timings'].get(stage),
+        }
+        for stage in TIMED_STAGES if stage in ref['timings'] or stage in cand['timings']
+    }
+    report['equivalent'] = not (
+        report['errors'] or
+        report['indicators']['missing'] or report['indicators']['extra'] or
+        report['indicators'].get('length') or report['indicators']['mismatched'] or
+        report['signals'] or report['exit_reasons'])
+    return report
+
+
+def _failed_report(name: str, dataframe: DataFrame, error: Exception) -> dict:
+    """Stand-in report for a fixture the harness itself could not compare."""
+    return {
+        'fixture': name,
+        'candles': len(dataframe),
+        'entries_replayed': 0,
+        'errors': {'harness': _describe_error('compare_fixture', error)},
+        'notes': {},
+        'indicators': {'missing': [], 'extra': [], 'mismatched': {}},
+        'signals': {},
+        'exit_reasons': {},
+        'timings': {},
+        'equivalent': False,
+    }
+
+
+def default_fixtures() -> Dict[str, DataFrame]:
+    return {
+        'synthetic_trend': synthetic_ohlcv(seed=1, drift=-0.0002, volatility=0.006),
+        'synthetic_chop': synthetic_ohlcv(seed=2, volatility=0.008),
+        'synthetic_flat': synthetic_ohlcv(seed=3, volatility=0.008, flat_candles=60),
+    }
+
+
+def _format_ms(seconds: Optional[float]) -> str:
+    return f'{seconds * 1000:9.2f} ms' if seconds is not None else f"{'-':>12}"
+
+
+def print_report(report: dict):
+    status = 'OK' if report['equivalent'] else 'DIFF'
+    print(f"[{status}] {report['fixture']} ({report['candles']} candles, "
+          f"{report['entries_replayed']} entries replayed)")
+
+    for side, error in report['errors'].items():
+        print(f"  {side} failed in {error}")
+    for side, notes in report['notes'].items():
+        for note in notes:
+            print(f"  {side} note: {note}")
+    indicators = report['indicators']
+    if indicators.get('length'):
+        print(f"  length differs: {indicators['length']}")
+    for key in ('missing', 'extra'):
+        if indicators[key]:
+            print(f"  {key} columns: {', '.join(indicators[key])}")
+    for column, mismatch in indicators['mismatched'].items():
+        if 'length' in mismatch:
+            print(f"  {column}: length differs: {mismatch['length']}")
+            continue
+        print(f"  {column}: {mismatch['count']} rows differ, first at {mismatch['first_row']} "
+              f"({mismatch['reference']} vs {mismatch['candidate']})")
+    if 'length' in report['signals']:
+        print(f"  analyzed length differs: {report['signals']['length']}")
+    for column, mismatch in report['signals'].items():
+        if column != 'length':
+            print(f"  {column} signal: {mismatch['count']} rows differ, e.g. {mismatch['rows'][:5]}")
+    for row, mismatch in list(report['exit_reasons'].items())[:10]:
+        print(f"  exit from row {row}: {mismatch['reference']} vs {mismatch['candidate']}")
+
+    for stage, timing in report['timings'].items():
+        ref, cand = timing['reference'], timing['candidate']
+        speedup = f'x{ref / cand:.2f}' if ref and cand else '-'
+        print(f"  {stage:<22} {_format_ms(ref)} -> {_format_ms(cand)}  {speedup}")
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Numerical-equivalence and speed harness for NFI5MOHO_WIP.')
+    parser.add_argument('--reference', default='NFI5MOHO_WIP:NFI5MOHO_WIP',
+                        help="Reference strategy as 'module:Class' (default: %(default)s)")
+    parser.add_argument('--candidate', default=None,
+                        help="Candidate strategy as 'module:Class' (default: the reference)")
+    parser.add_argument('--fixture', action='append', default=[],
+                        help='Recorded OHLCV file (json/feather/csv). May be repeated.')
+    parser.add_argument('--informative', action='append', default=[],
+                        help='Recorded informative-timeframe file, matched to --fixture by position.')
+    parser.add_argument('--no-synthetic', action='store_true', help='Skip the synthetic fixtures.')
+    parser.add_argument('--pair', default='BTC/USDT')
+    parser.add_argument('--rtol', type=float, default=1e-9)
+    parser.add_argument('--atol', type=float, default=1e-9)
+    parser.add_argument('--repeat', type=int, default=3, help='Timing repetitions, best is kept.')
+    parser.add_argument('--max-trades', type=int, default=200, help='Entries replayed through custom_exit.')
+    parser.add_argument('--output', default=None, help='Write the full report as JSON.')
+    options = parser.parse_args(args)
+
+    if options.no_synthetic and not options.fixture:
+        parser.error('--no-synthetic needs at least one --fixture')
+    if len(set(options.fixture)) != len(options.fixture):
+        parser.error('the same --fixture was given more than once')
+    if len(options.informative) > len(options.fixture):
+        parser.error('more --informative files than --fixture files')
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    reference_cls = load_strategy_class(options.reference)
+    candidate_cls = load_strategy_class(options.candidate) if options.candidate else reference_cls
+
+    fixtures = {} if options.no_synthetic else default_fixtures()
+    informatives = {}
+    for index, path in enumerate(options.fixture):
+        fixtures[path] = load_ohlcv(path)
+        if index < len(options.informative):
+            informatives[path] = load_ohlcv(options.informative[index])
+
+    reports = []
+    for name, dataframe in fixtures.items():
+        try:
+            report = compare_fixture(
+                reference_cls, candidate_cls, name, dataframe, informatives.get(name), pair=options.pair,
+                rtol=options.rtol, atol=options.atol, repeat=options.repeat, max_trades=options.max_trades)
+        except Exception as e:
+            report = _failed_report(name, dataframe, e)
+        print_report(report)
+        reports.append(report)
+
+    if options.output:
+        with open(options.output, 'w') as f:
+            json.dump(reports, f, indent=2, default=str)
+
+    return 0 if all(report['equivalent'] for report in reports) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
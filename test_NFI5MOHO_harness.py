@@ -0,0 +1,289 @@
+import json
+import sys
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas import DataFrame
+
+import NFI5MOHO_harness as harness
+
+
+def EWO(dataframe, sma1_length=5, sma2_length=35):
+    return dataframe['close'].rolling(sma1_length).mean() - dataframe['close'].rolling(sma2_length).mean()
+
+
+class StubStrategy:
+    """Stand-in with the NFI5MOHO_WIP surface the harness drives, without freqtrade or TA-Lib."""
+    timeframe = '5m'
+    inf_1h = '1h'
+    exit_rsi = 60.0
+    fast_ewo = types.SimpleNamespace(value=5)
+    slow_ewo = types.SimpleNamespace(value=20)
+
+    def __init__(self, config):
+        self.config = config
+
+    def normal_tf_indicators(self, dataframe, metadata):
+        dataframe['rsi'] = dataframe['close'].pct_change().rolling(14).mean() * 1000 + 50
+        return dataframe
+
+    def populate_indicators(self, dataframe, metadata):
+        dataframe = self.normal_tf_indicators(dataframe, metadata)
+        informative = self.dp.get_pair_dataframe(pair=metadata['pair'], timeframe=self.inf_1h)
+        dataframe['close_1h'] = dataframe['date'].dt.floor('1h').map(informative.set_index('date')['close'])
+        dataframe['trend'] = np.where(dataframe['rsi'] > 50, 'up', 'down')
+        return dataframe
+
+    def populate_entry_trend(self, dataframe, metadata):
+        dataframe.loc[dataframe['rsi'] < 45, 'buy'] = 1
+        return dataframe
+
+    def populate_exit_trend(self, dataframe, metadata):
+        dataframe.loc[dataframe['rsi'] > 55, 'sell'] = 1
+        return dataframe
+
+    def custom_exit(self, pair, trade, current_time, current_rate, current_profit, **kwargs):
+        dataframe, _ = self.dp.get_analyzed_dataframe(pair, self.timeframe)
+        last_candle = dataframe.iloc[-1]
+        if last_candle['rsi'] > self.exit_rsi:
+            return (f'custom_sell_profit_1_rsi_{last_candle["rsi"]}', current_profit)
+        return None
+
+
+class ShiftedExitStrategy(StubStrategy):
+    exit_rsi = 52.0
+
+
+class BrokenStrategy(StubStrategy):
+    def populate_entry_trend(self, dataframe, metadata):
+        raise ValueError('boom')
+
+
+class ShortStrategy(StubStrategy):
+    def populate_exit_trend(self, dataframe, metadata):
+        return super().populate_exit_trend(dataframe, metadata).iloc[:-1]
+
+
+class ReindexedStrategy(StubStrategy):
+    def populate_indicators(self, dataframe, metadata):
+        dataframe = super().populate_indicators(dataframe, metadata)
+        dataframe.index = dataframe.index + 1000
+        return dataframe
+
+
+class FoldedStrategy(StubStrategy):
+    """normal_tf_indicators folded into populate_indicators, as an optimised candidate might do."""
+    normal_tf_indicators = None
+
+    def populate_indicators(self, dataframe, metadata):
+        dataframe['rsi'] = dataframe['close'].pct_change().rolling(14).mean() * 1000 + 50
+        informative = self.dp.get_pair_dataframe(pair=metadata['pair'], timeframe=self.inf_1h)
+        dataframe['close_1h'] = dataframe['date'].dt.floor('1h').map(informative.set_index('date')['close'])
+        dataframe['trend'] = np.where(dataframe['rsi'] > 50, 'up', 'down')
+        return dataframe
+
+
+class InlinedStrategy(FoldedStrategy):
+    """Keeps normal_tf_indicators around, but populate_indicators no longer calls it."""
+    normal_tf_indicators = StubStrategy.normal_tf_indicators
+
+
+@pytest.fixture
+def candles():
+    return harness.synthetic_ohlcv(candles=600, seed=7, volatility=0.01)
+
+
+def test_column_mismatch_tolerance_and_nan_alignment():
+    reference = pd.Series([np.nan, 1.0, 2.0, 3.0])
+    assert harness._column_mismatch(reference, reference + 1e-12, 1e-9, 1e-9) is None
+
+    shifted_nan = pd.Series([0.0, 1.0, 2.0, 3.0])
+    mismatch = harness._column_mismatch(reference, shifted_nan, 1e-9, 1e-9)
+    assert mismatch['count'] == 1
+    assert mismatch['first_row'] == 0
+    assert mismatch['reference'] is None
+
+    perturbed = pd.Series([np.nan, 1.0, 2.5, 3.0])
+    mismatch = harness._column_mismatch(reference, perturbed, 1e-9, 1e-9)
+    assert mismatch['count'] == 1
+    assert mismatch['first_row'] == 2
+    assert mismatch['max_abs_diff'] == pytest.approx(0.5)
+
+
+def test_column_mismatch_exact_for_bool_and_object():
+    flags = pd.Series([True, False, True])
+    assert harness._column_mismatch(flags, flags.copy(), 1.0, 1.0) is None
+    assert harness._column_mismatch(flags, pd.Series([True, True, True]), 1.0, 1.0)['first_row'] == 1
+
+    tags = pd.Series(['a', None, 'c'])
+    assert harness._column_mismatch(tags, pd.Series(['a', None, 'c']), 1e-9, 1e-9) is None
+    assert harness._column_mismatch(tags, pd.Series(['a', None, 'd']), 1e-9, 1e-9)['count'] == 1
+
+
+def test_diff_columns_reports_perturbed_missing_and_extra(candles):
+    candidate = candles.copy()
+    candidate.loc[100, 'close'] *= 1.001
+    candidate['extra'] = 0.0
+    candidate = candidate.drop(columns=['volume'])
+
+    result = harness.diff_columns(candles, candidate, 1e-9, 1e-9)
+    assert list(result['mismatched']) == ['close']
+    assert result['mismatched']['close']['first_row'] == 100
+    assert result['missing'] == ['volume']
+    assert result['extra'] == ['extra']
+
+
+def test_diff_signals_reports_flipped_row():
+    reference = DataFrame({'buy': [1, np.nan, 1, np.nan], 'sell': [np.nan, 1, np.nan, np.nan]})
+    candidate = DataFrame({'buy': [1, 0, np.nan, np.nan], 'sell': [np.nan, 1, np.nan, np.nan]})
+    assert harness.diff_signals(reference, reference.copy()) == {}
+    assert harness.diff_signals(reference, candidate) == {'buy': {'count': 1, 'rows': [2]}}
+
+
+def test_split_reason():
+    tag, values = harness.split_reason('custom_sell_trail_qtpylib_profit_max_0.42_current_profit_-2.3e-05')
+    assert tag == 'custom_sell_trail_qtpylib_profit_max_{}_current_profit_{}'
+    assert values == [0.42, -2.3e-05]
+
+    tag, values = harness.split_reason('custom_sell_profit_4_qtpylib_rsi_nan')
+    assert tag == 'custom_sell_profit_4_qtpylib_rsi_{}'
+    assert np.isnan(values[0])
+
+
+def test_diff_exit_reasons():
+    reference = {
+        10: (20, 'custom_sell_profit_1_qtpylib_rsi_45.0'),
+        30: (40, 'custom_sell_profit_1_qtpylib_rsi_45.0'),
+        50: (60, 'custom_sell_profit_1_qtpylib_rsi_45.0'),
+        70: None,
+    }
+    candidate = {
+        10: (20, 'custom_sell_profit_1_qtpylib_rsi_45.0000000000001'),
+        30: (40, 'custom_sell_profit_2_qtpylib_rsi_45.0'),
+        50: (61, 'custom_sell_profit_1_qtpylib_rsi_45.0'),
+        70: (80, 'custom_sell_profit_1_qtpylib_rsi_45.0'),
+    }
+    assert sorted(harness.diff_exit_reasons(reference, candidate, 1e-9, 1e-9)) == ['30', '50', '70']
+    assert harness.diff_exit_reasons(reference, dict(reference), 1e-9, 1e-9) == {}
+
+
+def test_resample_ohlcv(candles):
+    hourly = harness.resample_ohlcv(candles, '1h')
+    first = candles.iloc[:12]
+    assert len(hourly) == 50
+    assert hourly.loc[0, 'date'] == candles.loc[0, 'date']
+    assert hourly.loc[0, 'open'] == first['open'].iloc[0]
+    assert hourly.loc[0, 'high'] == first['high'].max()
+    assert hourly.loc[0, 'low'] == first['low'].min()
+    assert hourly.loc[0, 'close'] == first['close'].iloc[-1]
+    assert hourly.loc[0, 'volume'] == pytest.approx(first['volume'].sum())
+
+
+def test_load_ohlcv_json_and_feather(tmp_path, candles):
+    rows = [[int(row.date.timestamp() * 1000), row.open, row.high, row.low, row.close, row.volume]
+            for row in candles.itertuples()]
+    json_path = tmp_path / 'BTC_USDT-5m.json'
+    json_path.write_text(json.dumps(rows))
+    pd.testing.assert_frame_equal(harness.load_ohlcv(str(json_path)), candles, check_dtype=False)
+
+    pytest.importorskip('pyarrow')
+    feather_path = tmp_path / 'BTC_USDT-5m.feather'
+    candles.to_feather(feather_path)
+    pd.testing.assert_frame_equal(harness.load_ohlcv(str(feather_path)), candles, check_dtype=False)
+
+
+def test_replay_exits_with_stub_strategy(candles):
+    metadata = {'pair': 'BTC/USDT'}
+    run = harness.run_strategy(ShiftedExitStrategy, candles, harness.resample_ohlcv(candles, '1h'), metadata, repeat=1)
+    assert run['error'] is None
+
+    analyzed = run['analyzed']
+    entry_rows = np.flatnonzero(analyzed['buy'].fillna(0).to_numpy() == 1)[:5].tolist()
+    exits = harness.replay_exits(run['strategy'], analyzed, entry_rows, metadata)
+    assert list(exits) == entry_rows
+    assert any(exits.values())
+    for row, exit_ in exits.items():
+        if exit_ is not None:
+            exit_row, reason = exit_
+            assert exit_row > row
+            assert analyzed.loc[exit_row, 'rsi'] > ShiftedExitStrategy.exit_rsi
+            assert reason.startswith('custom_sell_profit_1_rsi_')
+
+
+def test_compare_fixture_equivalent(candles):
+    report = harness.compare_fixture(StubStrategy, StubStrategy, 'stub', candles, repeat=1, max_trades=20)
+    assert report['equivalent']
+    assert report['entries_replayed'] > 0
+    assert set(report['timings']) >= {'informative_merge', 'populate_indicators', 'custom_exit_replay'}
+
+
+def test_compare_fixture_reports_changed_exit_reason(candles):
+    report = harness.compare_fixture(StubStrategy, ShiftedExitStrategy, 'stub', candles, repeat=1, max_trades=20)
+    assert not report['equivalent']
+    assert report['exit_reasons']
+    assert not report['signals']
+
+
+def test_compare_fixture_records_candidate_error(candles):
+    report = harness.compare_fixture(StubStrategy, BrokenStrategy, 'stub', candles, repeat=1, max_trades=20)
+    assert not report['equivalent']
+    assert report['errors'] == {'candidate': 'populate_entry_trend: ValueError: boom'}
+    assert report['timings']['populate_entry_trend']['candidate'] is None
+
+
+def test_compare_fixture_survives_shorter_candidate(candles):
+    report = harness.compare_fixture(StubStrategy, ShortStrategy, 'stub', candles, repeat=1, max_trades=20)
+    assert not report['equivalent']
+    assert report['signals'] == {'length': [600, 599]}
+    assert report['exit_reasons'] == {}
+    assert report['entries_replayed'] == 0
+
+
+def test_compare_fixture_diffs_reindexed_candidate_positionally(candles):
+    report = harness.compare_fixture(StubStrategy, ReindexedStrategy, 'stub', candles, repeat=1, max_trades=20)
+    assert report['equivalent']
+    assert report['errors'] == {}
+
+
+def test_compare_fixture_folded_normal_tf_indicators_is_timing_only(candles):
+    report = harness.compare_fixture(StubStrategy, FoldedStrategy, 'stub', candles, repeat=1, max_trades=20)
+    assert report['equivalent']
+    assert report['timings']['normal_tf_indicators']['candidate'] is None
+    assert report['timings']['informative_merge']['candidate'] is None
+    assert report['notes']['candidate']
+
+    report = harness.compare_fixture(StubStrategy, InlinedStrategy, 'stub', candles, repeat=1, max_trades=20)
+    assert report['equivalent']
+    assert report['timings']['normal_tf_indicators']['candidate'] is not None
+    assert report['timings']['informative_merge']['candidate'] is None
+    assert 'informative_merge not timed' in report['notes']['candidate'][0]
+
+
+def test_compare_fixture_reports_candidate_without_ewo(candles, monkeypatch):
+    module = types.ModuleType('stub_candidate_without_ewo')
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    candidate = type('NoEwoStrategy', (StubStrategy,), {'__module__': module.__name__})
+
+    report = harness.compare_fixture(StubStrategy, candidate, 'stub', candles, repeat=1, max_trades=20)
+    assert not report['equivalent']
+    assert report['indicators']['missing'] == ['EWO()']
+
+
+def test_compare_fixture_nfi5moho_against_itself():
+    pytest.importorskip('talib')
+    pytest.importorskip('freqtrade')
+    from NFI5MOHO_WIP import NFI5MOHO_WIP
+
+    candles = harness.synthetic_ohlcv(candles=1000, seed=2, volatility=0.008)
+    report = harness.compare_fixture(NFI5MOHO_WIP, NFI5MOHO_WIP, 'synthetic', candles, repeat=1)
+    assert report['errors'] == {}
+    assert report['equivalent']
+    assert report['entries_replayed'] > 0
+    assert 'EWO' in report['timings']
+
+
+def test_main_rejects_empty_fixture_set():
+    with pytest.raises(SystemExit):
+        harness.main(['--no-synthetic'])